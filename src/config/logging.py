@@ -4,52 +4,64 @@ import sys
 from loguru import logger
 from .settings import get_settings
 
+_DEV_DEBUG_FORMAT = (
+    "<green>{time:HH:mm:ss}</green> | <level>{level: <8}</level> | "
+    "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>"
+)
+
+# Static logger.add() arguments; setup_logging only merges in the settings-driven keys
+_CONSOLE_SPEC = {"sink": sys.stderr, "colorize": True, "backtrace": True, "diagnose": True}
+_FILE_SPEC_BASE = {"compression": "zip", "backtrace": True, "diagnose": True}
+_DEV_DEBUG_SPEC = {"sink": sys.stderr, "level": "DEBUG", "format": _DEV_DEBUG_FORMAT, "colorize": True}
+
+_configured = False
+
+
+def _only_debug(record) -> bool:
+    return record["level"].name == "DEBUG"
+
 
 def setup_logging() -> None:
-    """Configure loguru logging based on settings."""
+    """Configure loguru logging based on settings.
+    
+    Safe to call more than once; handlers are only installed on the first call.
+    """
+    global _configured
+    if _configured:
+        return
+    
     settings = get_settings()
+    log_settings = settings.logging
+    min_level = log_settings.level
     
     # Remove default handler
     logger.remove()
     
     # Add console handler
-    logger.add(
-        sys.stderr,
-        level=settings.logging.level,
-        format=settings.logging.format,
-        colorize=True,
-        backtrace=True,
-        diagnose=True
-    )
+    logger.add(**_CONSOLE_SPEC, level=min_level, format=log_settings.format)
     
     # Add file handler if specified
-    if settings.logging.file_path:
+    if log_settings.file_path:
         logger.add(
-            settings.logging.file_path,
-            level=settings.logging.level,
-            format=settings.logging.format,
-            rotation=settings.logging.rotation,
-            retention=settings.logging.retention,
-            compression="zip",
-            backtrace=True,
-            diagnose=True
+            log_settings.file_path,
+            **_FILE_SPEC_BASE,
+            level=min_level,
+            format=log_settings.format,
+            rotation=log_settings.rotation,
+            retention=log_settings.retention
         )
     
-    # Set log level based on environment
-    if settings.environment == "development":
-        logger.add(
-            sys.stderr,
-            level="DEBUG",
-            format="<green>{time:HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
-            colorize=True,
-            filter=lambda record: record["level"].name == "DEBUG"
-        )
+    # Surface DEBUG records in development; the console handler already emits them at DEBUG level
+    if settings.environment == "development" and min_level != "DEBUG":
+        logger.add(**_DEV_DEBUG_SPEC, filter=_only_debug)
+    
+    _configured = True
     
     logger.info(f"Logging configured for {settings.environment} environment")
-    logger.info(f"Log level: {settings.logging.level}")
+    logger.info(f"Log level: {min_level}")
     
-    if settings.logging.file_path:
-        logger.info(f"Log file: {settings.logging.file_path}")
+    if log_settings.file_path:
+        logger.info(f"Log file: {log_settings.file_path}")
 
 
 def get_logger(name: str):
@@ -1,74 +1,114 @@
+from dataclasses import dataclass
 from typing import Optional, Literal
-from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from functools import lru_cache
+from functools import cached_property, lru_cache
+from pathlib import Path
+
+# Project directory; MCP clients often start the server from $HOME or /, so relative
+# file settings are anchored here rather than at the working directory
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+
+def _project_path(path: Optional[str]) -> Optional[str]:
+    """Resolve a relative path against PROJECT_ROOT; None or empty is passed through."""
+    if not path:
+        return path
+    return str(PROJECT_ROOT / Path(path).expanduser())
+
+
+@dataclass(frozen=True, slots=True)
+class ExchangeConfig:
+    """Exchange configuration namespace."""
+    api_key: Optional[str]
+    api_secret: Optional[str]
+    sandbox_mode: bool
+    rate_limit: bool
+    default_type: str
+    recv_window: int
+    markets_cache_path: Optional[str]
+
+
+@dataclass(frozen=True, slots=True)
+class MCPConfig:
+    """MCP configuration namespace."""
+    server_name: str
+
+
+@dataclass(frozen=True, slots=True)
+class LoggingConfig:
+    """Logging configuration namespace."""
+    level: str
+    format: str
+    file_path: Optional[str]
+    rotation: str
+    retention: str
+
 
 class Settings(BaseSettings):
     """Main settings class with all configuration options."""
     
     # Exchange settings
-    exchange_api_key: Optional[str] = Field(None, env="EXCHANGE_API_KEY")
-    exchange_api_secret: Optional[str] = Field(None, env="EXCHANGE_API_SECRET")
-    exchange_sandbox_mode: bool = Field(True, env="EXCHANGE_SANDBOX_MODE")
-    exchange_rate_limit: bool = Field(True, env="EXCHANGE_RATE_LIMIT")
-    exchange_default_type: Literal["spot", "future", "margin"] = Field("future", env="EXCHANGE_DEFAULT_TYPE")
+    exchange_api_key: Optional[str] = None
+    exchange_api_secret: Optional[str] = None
+    exchange_sandbox_mode: bool = True
+    exchange_rate_limit: bool = True
+    exchange_default_type: Literal["spot", "future", "margin"] = "future"
+    exchange_recv_window: int = 5000
+    exchange_markets_cache_path: Optional[str] = ".cache/markets.json"
     
     # MCP settings
-    mcp_server_name: str = Field("Trading MCP", env="MCP_SERVER_NAME")
+    mcp_server_name: str = "Trading MCP"
     
     # Logging settings
-    log_level: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] = Field("INFO", env="LOG_LEVEL")
-    log_format: str = Field(
-        "{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}", 
-        env="LOG_FORMAT"
-    )
-    log_file_path: Optional[str] = Field(None, env="LOG_FILE_PATH")
-    log_rotation: str = Field("1 day", env="LOG_ROTATION")
-    log_retention: str = Field("30 days", env="LOG_RETENTION")
+    log_level: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] = "INFO"
+    log_format: str = "{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}"
+    log_file_path: Optional[str] = None
+    log_rotation: str = "1 day"
+    log_retention: str = "30 days"
     
     # General settings
-    debug: bool = Field(False, env="DEBUG")
-    environment: Literal["development", "production"] = Field("production", env="ENVIRONMENT")
+    debug: bool = False
+    environment: Literal["development", "production"] = "production"
     
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
-        extra="ignore"
+        extra="ignore",
+        frozen=True,
+        revalidate_instances="never"
     )
     
-    # Convenience properties to maintain backward compatibility
-    @property
-    def exchange(self):
+    # Convenience namespaces to maintain backward compatibility, built once per instance
+    @cached_property
+    def exchange(self) -> ExchangeConfig:
         """Exchange configuration namespace."""
-        class ExchangeConfig:
-            def __init__(self, settings):
-                self.api_key = settings.exchange_api_key
-                self.api_secret = settings.exchange_api_secret
-                self.sandbox_mode = settings.exchange_sandbox_mode
-                self.rate_limit = settings.exchange_rate_limit
-                self.default_type = settings.exchange_default_type
-        return ExchangeConfig(self)
+        return ExchangeConfig(
+            api_key=self.exchange_api_key,
+            api_secret=self.exchange_api_secret,
+            sandbox_mode=self.exchange_sandbox_mode,
+            rate_limit=self.exchange_rate_limit,
+            default_type=self.exchange_default_type,
+            recv_window=self.exchange_recv_window,
+            markets_cache_path=_project_path(self.exchange_markets_cache_path),
+        )
     
-    @property
-    def mcp(self):
+    @cached_property
+    def mcp(self) -> MCPConfig:
         """MCP configuration namespace."""
-        class MCPConfig:
-            def __init__(self, settings):
-                self.server_name = settings.mcp_server_name
-        return MCPConfig(self)
+        return MCPConfig(server_name=self.mcp_server_name)
     
-    @property
-    def logging(self):
+    @cached_property
+    def logging(self) -> LoggingConfig:
         """Logging configuration namespace."""
-        class LoggingConfig:
-            def __init__(self, settings):
-                self.level = settings.log_level
-                self.format = settings.log_format
-                self.file_path = settings.log_file_path
-                self.rotation = settings.log_rotation
-                self.retention = settings.log_retention
-        return LoggingConfig(self)
+        return LoggingConfig(
+            level=self.log_level,
+            format=self.log_format,
+            file_path=self.log_file_path,
+            rotation=self.log_rotation,
+            retention=self.log_retention,
+        )
 
-@lru_cache()
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
+    """Return the process-wide settings instance, parsing env/.env on first call only."""
     return Settings()
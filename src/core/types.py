@@ -1,19 +1,19 @@
 """Common type definitions for the trading MCP project."""
 
-from enum import Enum
+from enum import StrEnum
 from typing import Dict, Any, Optional, Union
 from decimal import Decimal
 from dataclasses import dataclass
 from datetime import datetime
 
 
-class OrderSide(str, Enum):
+class OrderSide(StrEnum):
     """Order side enumeration."""
     BUY = "BUY"
     SELL = "SELL"
 
 
-class OrderType(str, Enum):
+class OrderType(StrEnum):
     """Order type enumeration."""
     MARKET = "market"
     LIMIT = "limit"
@@ -21,7 +21,7 @@ class OrderType(str, Enum):
     STOP_LIMIT = "stop_limit"
 
 
-class OrderStatus(str, Enum):
+class OrderStatus(StrEnum):
     """Order status enumeration."""
     PENDING = "pending"
     OPEN = "open"
@@ -31,20 +31,28 @@ class OrderStatus(str, Enum):
     REJECTED = "rejected"
 
 
-class PositionSide(str, Enum):
+class PositionSide(StrEnum):
     """Position side enumeration."""
     LONG = "long"
     SHORT = "short"
 
 
-class TimeInForce(str, Enum):
+class TimeInForce(StrEnum):
     """Time in force enumeration."""
     GTC = "GTC"  # Good Till Canceled
     IOC = "IOC"  # Immediate or Cancel
     FOK = "FOK"  # Fill or Kill
 
 
-@dataclass
+# Module-level aliases for members used on hot paths, avoiding the class attribute lookup
+BUY = OrderSide.BUY
+SELL = OrderSide.SELL
+MARKET = OrderType.MARKET
+LIMIT = OrderType.LIMIT
+CLOSED = OrderStatus.CLOSED
+
+
+@dataclass(frozen=True, slots=True)
 class Balance:
     """Balance information for a currency."""
     currency: str
@@ -58,25 +66,25 @@ class Balance:
         return self.total - self.available
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Position:
     """Position information."""
     symbol: str
     side: PositionSide
-    size: Decimal
-    entry_price: Decimal
-    mark_price: Decimal
-    unrealized_pnl: Decimal
-    percentage: Decimal
+    size: float
+    entry_price: float
+    mark_price: float
+    unrealized_pnl: float
+    percentage: float
     timestamp: datetime
     
     @property
-    def notional_value(self) -> Decimal:
+    def notional_value(self) -> float:
         """Calculate notional value of position."""
         return abs(self.size * self.mark_price)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Order:
     """Order information."""
     id: str
@@ -93,30 +101,38 @@ class Order:
     @property
     def is_filled(self) -> bool:
         """Check if order is completely filled."""
-        return self.status == OrderStatus.CLOSED and self.remaining == 0
+        return self.status == CLOSED and self.remaining == 0
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Ticker:
     """Market ticker information."""
     symbol: str
-    bid: Decimal
-    ask: Decimal
-    last: Decimal
-    volume: Decimal
+    bid: float
+    ask: float
+    last: float
+    volume: float
     timestamp: datetime
     
     @property
-    def spread(self) -> Decimal:
+    def spread(self) -> float:
         """Calculate bid-ask spread."""
         return self.ask - self.bid
     
     @property
-    def mid_price(self) -> Decimal:
+    def mid_price(self) -> float:
         """Calculate mid price."""
         return (self.bid + self.ask) / 2
 
 
+def to_decimal_for_exchange(x: float, tick: Decimal) -> Decimal:
+    """Convert a float value to a Decimal rounded to the exchange tick size.
+    
+    Display-side types use float; Decimal is reserved for values submitted to the exchange.
+    """
+    return (Decimal(str(x)) / tick).to_integral_value() * tick
+
+
 # Type aliases for common data structures
 BalanceDict = Dict[str, Balance]
 PositionDict = Dict[str, Position]
@@ -1,5 +1,38 @@
-from typing import Dict, Any, List
-from ccxt.base.types import Balances, Position
+from __future__ import annotations
+
+from dataclasses import dataclass
+from operator import itemgetter
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from ccxt.base.types import Balances
+
+# Field extractors for Binance futures info.assets / info.positions entries
+_asset_fields = itemgetter('asset', 'walletBalance', 'availableBalance', 'unrealizedProfit')
+_position_fields = itemgetter('symbol', 'positionAmt')
+
+# Exact-zero spellings Binance uses for empty balances and flat positions; lets the
+# common case skip float()
+_ZERO_AMOUNTS = frozenset(('0', '0.0', '0.00', '0.000', '0.0000', '0.00000', '0.00000000', ''))
+
+# Last info.assets list seen and its asset -> entry index. Holding a reference to the
+# list keeps the identity check safe; payloads from ccxt are never mutated in place.
+_assets_index_cache: Tuple[Optional[List[Dict[str, Any]]], Dict[str, Dict[str, Any]]] = (None, {})
+
+
+def _assets_index(balance_data: Balances) -> Dict[str, Dict[str, Any]]:
+    """Index Binance futures info.assets by asset code, reusing the index for the same payload"""
+    global _assets_index_cache
+    
+    assets = balance_data['info']['assets']
+    cached_assets, index = _assets_index_cache
+    if cached_assets is not assets:
+        index = {}
+        for asset in assets:
+            index.setdefault(asset.get('asset'), asset)
+        _assets_index_cache = (assets, index)
+    return index
+
 
 def format_balance_for_llm(balance_data: Balances) -> str:
     """Format balance data with optional positions into a human-readable string for LLM understanding"""
@@ -7,7 +40,7 @@ def format_balance_for_llm(balance_data: Balances) -> str:
     if not balance_data:
         return "No balance data available"
     
-    formatted_text = ""
+    parts: List[str] = []
     
     # Handle Binance futures format with info.assets
     if 'info' in balance_data and 'assets' in balance_data['info']:
@@ -17,51 +50,56 @@ def format_balance_for_llm(balance_data: Balances) -> str:
         # Get total unrealized profit from info
         total_unrealized_profit = float(balance_data['info'].get('totalUnrealizedProfit', 0))
         
-        # Process each asset with non-zero balance
+        # Parse open positions once instead of rescanning every position per asset
+        active_positions = []
+        for pos in positions:
+            symbol, position_amt = _position_fields(pos)
+            if position_amt in _ZERO_AMOUNTS:
+                continue
+            position_amt = float(position_amt)
+            if position_amt != 0:
+                # V3 account positions spell it unrealizedProfit, V2 unRealizedProfit
+                pnl = pos.get('unrealizedProfit', pos.get('unRealizedProfit', 0))
+                active_positions.append((symbol, position_amt, float(pnl)))
+        
+        # Process each asset with non-zero balance; most futures assets are empty
         for asset in assets:
-            wallet_balance = float(asset.get('walletBalance', 0))
+            asset_name, wallet_balance, available_balance, asset_unrealized_pnl = _asset_fields(asset)
+            if wallet_balance in _ZERO_AMOUNTS:
+                continue
+            wallet_balance = float(wallet_balance)
             if wallet_balance > 0:
-                asset_name = asset.get('asset', 'Unknown')
-                available_balance = float(asset.get('availableBalance', 0))
-                asset_unrealized_pnl = float(asset.get('unrealizedProfit', 0))
+                available_balance = float(available_balance)
+                asset_unrealized_pnl = float(asset_unrealized_pnl)
                 
                 # Calculate used amount (wallet balance - available balance)
                 used_amount = wallet_balance - available_balance
                 
-                formatted_text += f"- {asset_name}: {wallet_balance}\n"
-                formatted_text += f"  - Available: {available_balance}\n"
-                formatted_text += f"  - In Use: {used_amount}\n"
+                parts.append(
+                    f"- {asset_name}: {wallet_balance}\n"
+                    f"  - Available: {available_balance}\n"
+                    f"  - In Use: {used_amount}\n"
+                )
                 
                 # Add asset-level PnL if non-zero
                 if asset_unrealized_pnl != 0:
-                    formatted_text += f"  - Asset PnL: {asset_unrealized_pnl}\n"
+                    parts.append(f"  - Asset PnL: {asset_unrealized_pnl}\n")
                 
-                # Check for positions related to this asset
-                asset_positions = []
-                asset_position_pnl = 0.0
-                for pos in positions:
-                    if float(pos.get('positionAmt', 0)) != 0:
-                        symbol = pos.get('symbol', '')
-                        # Check if position symbol contains this asset
-                        if asset_name in symbol:
-                            asset_positions.append(pos)
-                            asset_position_pnl += float(pos.get('unRealizedProfit', 0))
+                # Positions whose symbol contains this asset
+                asset_positions = [pos for pos in active_positions if asset_name in pos[0]]
                 
                 if asset_positions:
-                    formatted_text += "  - Active Positions:\n"
-                    for pos in asset_positions:
-                        symbol = pos.get('symbol', 'Unknown')
-                        position_amt = float(pos.get('positionAmt', 0))
-                        pnl = float(pos.get('unRealizedProfit', 0))
-                        side = "LONG" if position_amt > 0 else "SHORT"
-                        
-                        formatted_text += f"    * {symbol} ({side}): {position_amt} | PnL: {pnl}\n"
+                    parts.append("  - Active Positions:\n")
+                    parts.extend(
+                        f"    * {symbol} ({'LONG' if position_amt > 0 else 'SHORT'}): {position_amt} | PnL: {pnl}\n"
+                        for symbol, position_amt, pnl in asset_positions
+                    )
                 
-                formatted_text += "\n"
+                parts.append("\n")
         
         # Add total PnL summary
         if total_unrealized_profit != 0:
-            formatted_text += f"Total Unrealized PnL: {total_unrealized_profit}\n"
+            parts.append(f"Total Unrealized PnL: {total_unrealized_profit}\n")
     
     # Fallback to standard format using total/free/used
     else:
@@ -79,11 +117,13 @@ def format_balance_for_llm(balance_data: Balances) -> str:
             free_amount = free_balances.get(currency, 0)
             used_amount = used_balances.get(currency, 0)
             
-            formatted_text += f"- {currency}: {total_amount}\n"
-            formatted_text += f"  - Available: {free_amount}\n"
-            formatted_text += f"  - In Use: {used_amount}\n\n"
+            parts.append(
+                f"- {currency}: {total_amount}\n"
+                f"  - Available: {free_amount}\n"
+                f"  - In Use: {used_amount}\n\n"
+            )
     
-    return formatted_text.strip()
+    return "".join(parts).strip()
 
 def has_available_usdt(balance_data: Balances, minimum_amount: float = 0.0) -> bool:
     """
@@ -101,12 +141,10 @@ def has_available_usdt(balance_data: Balances, minimum_amount: float = 0.0) -> b
     
     # Handle Binance futures format with info.assets
     if 'info' in balance_data and 'assets' in balance_data['info']:
-        assets = balance_data['info']['assets']
-        for asset in assets:
-            if asset.get('asset') == 'USDT':
-                available_balance = float(asset.get('availableBalance', 0))
-                return available_balance >= minimum_amount
-        return False
+        usdt = _assets_index(balance_data).get('USDT')
+        if usdt is None:
+            return False
+        return float(usdt.get('availableBalance', 0)) >= minimum_amount
     
     # Fallback to standard format
     else:
@@ -129,39 +167,80 @@ def get_usdt_balance(balance_data: Balances) -> float:
     
     # Handle Binance futures format with info.assets
     if 'info' in balance_data and 'assets' in balance_data['info']:
-        assets = balance_data['info']['assets']
-        for asset in assets:
-            if asset.get('asset') == 'USDT':
-                return float(asset.get('availableBalance', 0))
-        return 0.0
+        usdt = _assets_index(balance_data).get('USDT')
+        if usdt is None:
+            return 0.0
+        return float(usdt.get('availableBalance', 0))
     
     # Fallback to standard format
     else:
         free_balances = balance_data.get('free', {})
         return float(free_balances.get('USDT', 0))
 
-def has_open_positions(balance_data: Balances) -> bool:
+@dataclass(frozen=True, slots=True)
+class PositionsSummary:
+    """Open positions derived from a single pass over info.positions"""
+    count: int
+    symbols: Tuple[str, ...]
+    any_open: bool
+
+
+_NO_POSITIONS = PositionsSummary(count=0, symbols=(), any_open=False)
+
+# Last info.positions list seen and its summary, cached the same way as the assets index
+_positions_summary_cache: Tuple[Optional[List[Dict[str, Any]]], PositionsSummary] = (None, _NO_POSITIONS)
+
+
+def _is_open_amount(position_amt: Any) -> bool:
+    """True if a positionAmt value is non-zero"""
+    if position_amt in _ZERO_AMOUNTS:
+        return False
+    return float(position_amt) != 0
+
+
+def summarize_positions(balance_data: Balances) -> PositionsSummary:
     """
-    Simple function to check if account has any open positions based on balance data
+    Summarize open positions based on balance data
     
     Args:
         balance_data: Balance data from exchange
     
     Returns:
-        True if has open positions, False otherwise
+        PositionsSummary with count, symbols and whether any position is open
     """
+    global _positions_summary_cache
+    
     if not balance_data:
-        return False
+        return _NO_POSITIONS
     
     # Handle Binance futures format with info.positions
-    if 'info' in balance_data and 'positions' in balance_data['info']:
-        positions = balance_data['info']['positions']
-        for position in positions:
-            position_amt = float(position.get('positionAmt', 0))
-            if position_amt != 0:
-                return True
+    if 'info' not in balance_data or 'positions' not in balance_data['info']:
+        return _NO_POSITIONS
     
-    return False
+    positions = balance_data['info']['positions']
+    cached_positions, summary = _positions_summary_cache
+    if cached_positions is not positions:
+        symbols = tuple(
+            position.get('symbol', 'Unknown')
+            for position in positions
+            if _is_open_amount(position.get('positionAmt', 0))
+        )
+        summary = PositionsSummary(count=len(symbols), symbols=symbols, any_open=bool(symbols))
+        _positions_summary_cache = (positions, summary)
+    return summary
+
+
+def has_open_positions(balance_data: Balances) -> bool:
+    """
+    Simple function to check if account has any open positions based on balance data
+    
+    Args:
+        balance_data: Balance data from exchange
+    
+    Returns:
+        True if has open positions, False otherwise
+    """
+    return summarize_positions(balance_data).any_open
 
 def get_open_positions_count(balance_data: Balances) -> int:
     """
@@ -173,19 +252,7 @@ def get_open_positions_count(balance_data: Balances) -> int:
     Returns:
         Number of open positions
     """
-    if not balance_data:
-        return 0
-    
-    count = 0
-    # Handle Binance futures format with info.positions
-    if 'info' in balance_data and 'positions' in balance_data['info']:
-        positions = balance_data['info']['positions']
-        for position in positions:
-            position_amt = float(position.get('positionAmt', 0))
-            if position_amt != 0:
-                count += 1
-    
-    return count
+    return summarize_positions(balance_data).count
 
 def get_open_positions_symbols(balance_data: Balances) -> List[str]:
     """
@@ -197,17 +264,4 @@ def get_open_positions_symbols(balance_data: Balances) -> List[str]:
     Returns:
         List of symbol names with open positions
     """
-    if not balance_data:
-        return []
-    
-    symbols = []
-    # Handle Binance futures format with info.positions
-    if 'info' in balance_data and 'positions' in balance_data['info']:
-        positions = balance_data['info']['positions']
-        for position in positions:
-            position_amt = float(position.get('positionAmt', 0))
-            if position_amt != 0:
-                symbol = position.get('symbol', 'Unknown')
-                symbols.append(symbol)
-    
-    return symbols
+    return list(summarize_positions(balance_data).symbols)
@@ -1,4 +1,5 @@
-from typing import Any
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Optional
 from mcp.server.fastmcp import FastMCP
 from loguru import logger
 
@@ -7,6 +8,7 @@ from ..services.exchange_client import ExchangeClient
 from .resources import register_resources
 from .tools import register_tools
 
+_TRANSPORT = "stdio"
 
 
 class MCPServer:    
@@ -15,14 +17,30 @@ class MCPServer:
         self.logger = logger.bind(component="mcp_server")
         
         self.logger.info("Initializing MCP server with name: {}".format(settings.mcp.server_name))
-        self.mcp: FastMCP[Any] = FastMCP(settings.mcp.server_name)
+        self.mcp: FastMCP[Any] = FastMCP(settings.mcp.server_name, lifespan=self._lifespan)
         
+        self._exchange_client: Optional[ExchangeClient] = None
         self._initialized = False
     
+    @asynccontextmanager
+    async def _lifespan(self, _: FastMCP[Any]) -> AsyncIterator[None]:
+        # The exchange HTTP session lives on the server's event loop; open and close it there
+        if self._exchange_client is not None:
+            await self._exchange_client.open()
+        try:
+            yield
+        finally:
+            if self._exchange_client is not None:
+                await self._exchange_client.close()
+    
     def initialize(self, exchange_client: ExchangeClient) -> None:
+        if self._initialized:
+            return
+        
         try:
             register_tools(self.mcp, exchange_client)
             register_resources(self.mcp, exchange_client)
+            self._exchange_client = exchange_client
             self._initialized = True
             self.logger.info("MCP server initialized successfully")
             
@@ -30,7 +48,7 @@ class MCPServer:
             self.logger.error(f"Failed to initialize MCP server: {e}")
             raise
     
-    def run(self, transport: str = "stdio") -> None:
+    def run(self, transport: str = _TRANSPORT) -> None:
         if not self._initialized:
             raise RuntimeError("MCP server not initialized. Call initialize() first.")
         
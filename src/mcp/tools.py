@@ -1,165 +1,152 @@
 """MCP tools registration and implementation."""
 
 from .resources_helper import format_balance_for_llm
-from typing import Any
+import inspect
+from functools import wraps
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Literal, Optional, Tuple
 from mcp.server.fastmcp import FastMCP
 from loguru import logger
 
-from ..core.types import OrderSide, OrderType
-from ..core.exceptions import TradingError, ValidationError
 from ..services.exchange_client import ExchangeClient
 
+if TYPE_CHECKING:
+    from ccxt.base.types import Balances
 
-def register_tools(mcp: FastMCP[Any], exchange_client: ExchangeClient) -> None:
-    @mcp.tool()
-    def open_market_long(symbol: str, usdt_amount: int) -> str:
-        """
-        Open long position with market current price.
+
+ToolHandler = Callable[..., Awaitable[str]]
+
+
+def _tool_errors(action: str) -> Callable[[ToolHandler], ToolHandler]:
+    """Turn any exception raised by a tool handler into a logged failure message."""
+    def decorator(handler: ToolHandler) -> ToolHandler:
+        log_message = "Tool " + handler.__name__.lstrip("_") + " failed: {}"
+        failure_prefix = "Failed to " + action + ": "
         
-        Args:
-            symbol: Trading symbol (e.g., 'BTCUSDT')
-            usdt_amount: Amount in USDT to trade
-            
-        Returns:
-            Position opening result message
-        """
-        try:
-            if not symbol:
-                raise ValidationError("Symbol is required")
-            
-            if usdt_amount <= 0:
-                raise ValidationError("USDT amount must be positive")
-            
-            exchange_client.market_buy(symbol, usdt_amount)
-            
-            return "Position opened successfully"
-                
-        except Exception as e:
-            logger.error(f"Tool open_market_long failed: {e}")
-            return f"Failed to open market long position: {str(e)}"
+        @wraps(handler)
+        async def wrapper(*args: Any, **kwargs: Any) -> str:
+            try:
+                return await handler(*args, **kwargs)
+            except Exception as e:
+                # Lazy so str(e) is only rendered when a sink accepts ERROR records
+                logger.opt(lazy=True).error(log_message, e.__str__)
+                return failure_prefix + str(e)
+        return wrapper
+    return decorator
+
+
+def _check(symbol: str, usdt_amount: Optional[int] = None) -> Optional[str]:
+    """Return the message for the first failing tool argument check, None if all pass."""
+    if not symbol:
+        return "Symbol is required"
+    if usdt_amount is not None and usdt_amount <= 0:
+        return "USDT amount must be positive"
+    return None
+
+
+# (order_type, side) -> unbound ExchangeClient method placing that order
+_OPEN_DISPATCH: Dict[Tuple[str, str], Callable[..., Awaitable[Dict[str, Any]]]] = {
+    ("market", "buy"): ExchangeClient.market_buy,
+    ("market", "sell"): ExchangeClient.market_sell,
+    ("limit", "buy"): ExchangeClient.limit_buy,
+    ("limit", "sell"): ExchangeClient.limit_sell,
+}
+
+
+@_tool_errors("open position")
+async def _open_position(
+    exchange_client: ExchangeClient,
+    symbol: str,
+    side: Literal["buy", "sell"],
+    order_type: Literal["market", "limit"],
+    usdt_amount: int,
+    price: Optional[int] = None
+) -> str:
+    """
+    Open a position with a market or limit order.
     
-    @mcp.tool()
-    def open_market_short(symbol: str, usdt_amount: int) -> str:
-        """
-        Open short position with market current price.
+    Args:
+        symbol: Trading symbol (e.g., 'BTCUSDT')
+        side: 'buy' to open long, 'sell' to open short
+        order_type: 'market' to fill at current price, 'limit' to place at price
+        usdt_amount: Amount in USDT to trade
+        price: Limit price, required for limit orders
         
-        Args:
-            symbol: Trading symbol (e.g., 'BTCUSDT')
-            usdt_amount: Amount in USDT to trade
-            
-        Returns:
-            Position opening result message
-        """
-        try:
-            if not symbol:
-                raise ValidationError("Symbol is required")
-            
-            if usdt_amount <= 0:
-                raise ValidationError("USDT amount must be positive")
-            
-            exchange_client.market_sell(symbol, usdt_amount)
-            
-            return "Position opened successfully"
-                
-        except Exception as e:
-            logger.error(f"Tool open_market_short failed: {e}")
-            return f"Failed to open market short position: {str(e)}"
-
-    @mcp.tool()
-    def open_limit_long(symbol: str, usdt_amount: int, price: int) -> str:
-        """
-        Open long position with limit order.
-        
-        Args:
-            symbol: Trading symbol (e.g., 'BTCUSDT')
-            usdt_amount: Amount in USDT to trade
-            price: Limit price
-            
-        Returns:
-            Position opening result message
-        """
-        try:
-            if not symbol:
-                raise ValidationError("Symbol is required")
-            
-            if usdt_amount <= 0:
-                raise ValidationError("USDT amount must be positive")
-            
-            exchange_client.limit_buy(symbol, usdt_amount, price)
-            
-            return "Position opened successfully"
-                
-        except Exception as e:
-            logger.error(f"Tool open_limit_long failed: {e}")
-            return f"Failed to open limit long position: {str(e)}"
+    Returns:
+        Position opening result message
+    """
+    err = _check(symbol, usdt_amount)
+    if err:
+        return err
     
-    @mcp.tool()
-    def open_limit_short(symbol: str, usdt_amount: int, price: int) -> str:
-        """
-        Open short position with limit order.
-        
-        Args:
-            symbol: Trading symbol (e.g., 'BTCUSDT')
-            usdt_amount: Amount in USDT to trade
-            price: Limit price
-            
-        Returns:
-            Position opening result message
-        """
-        try:
-            if not symbol:
-                raise ValidationError("Symbol is required")
-            
-            if usdt_amount <= 0:
-                raise ValidationError("USDT amount must be positive")
-            
-            exchange_client.limit_sell(symbol, usdt_amount, price)
-            
-            return "Position opened successfully"
-                
-        except Exception as e:
-            logger.error(f"Tool open_limit_short failed: {e}")
-            return f"Failed to open limit short position: {str(e)}"
+    # FastMCP has already checked side and order_type against their Literal choices
+    place_order = _OPEN_DISPATCH[(order_type, side)]
     
-    @mcp.tool()
-    def close_position(symbol: str) -> str:
-        """
-        Close all positions for a given symbol.
-        
-        Args:
-            symbol: Trading symbol to close positions for
-            
-        Returns:
-            Position closing result message
-        """
-        try:
-            if not symbol:
-                raise ValidationError("Symbol is required")
-            
-            result = exchange_client.close_position(symbol)
-            return result
-                
-        except Exception as e:
-            logger.error(f"Tool close_position failed: {e}")
-            return f"Failed to close position: {str(e)}"
-
-    @mcp.tool()
-    def get_balance() -> str:
-        """
-        Get current account balance.
+    if order_type == "limit":
+        if price is None:
+            return "Price is required for limit orders"
+        if price <= 0:
+            return "Price must be positive"
+        await place_order(exchange_client, symbol, usdt_amount, price)
+    else:
+        await place_order(exchange_client, symbol, usdt_amount)
+    
+    return "Position opened successfully"
+
+
+@_tool_errors("close position")
+async def _close_position(exchange_client: ExchangeClient, symbol: str) -> str:
+    """
+    Close all positions for a given symbol.
+    
+    Args:
+        symbol: Trading symbol to close positions for
         
-        Returns:
-            Account balance information
-        """
-        try:
-            account_balance: Balances = exchange_client.retrieve_balance()
-            formatted_balance = format_balance_for_llm(account_balance)
-            return formatted_balance
-            
-        except Exception as e:
-            logger.error(f"Tool get_balance failed: {e}")
-            return f"Failed to get account balance: {str(e)}"
+    Returns:
+        Position closing result message
+    """
+    err = _check(symbol)
+    if err:
+        return err
     
-    logger.info("MCP tools registered successfully")
+    result = await exchange_client.close_position(symbol)
+    return result
+
+
+@_tool_errors("get account balance")
+async def _get_balance(exchange_client: ExchangeClient) -> str:
+    """
+    Get current account balance.
+    
+    Returns:
+        Account balance information
+    """
+    account_balance: Balances = await exchange_client.retrieve_balance()
+    formatted_balance = format_balance_for_llm(account_balance)
+    return formatted_balance
+
 
+# Tool name -> handler. Handlers take the exchange client as their first argument.
+_TOOL_TABLE: Tuple[Tuple[str, ToolHandler], ...] = (
+    ("open_position", _open_position),
+    ("close_position", _close_position),
+    ("get_balance", _get_balance),
+)
 
+
+def _bind(name: str, handler: ToolHandler, exchange_client: ExchangeClient) -> ToolHandler:
+    """Bind exchange_client to a handler, exposing only the tool arguments to FastMCP."""
+    @wraps(handler)
+    async def tool(*args: Any, **kwargs: Any) -> str:
+        return await handler(exchange_client, *args, **kwargs)
+    
+    signature = inspect.signature(handler)
+    tool.__signature__ = signature.replace(parameters=tuple(signature.parameters.values())[1:])
+    tool.__name__ = tool.__qualname__ = name
+    return tool
+
+
+def register_tools(mcp: FastMCP[Any], exchange_client: ExchangeClient) -> None:
+    for name, handler in _TOOL_TABLE:
+        mcp.tool(name=name)(_bind(name, handler, exchange_client))
+    
+    logger.info("MCP tools registered successfully")
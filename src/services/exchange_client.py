@@ -1,8 +1,16 @@
 from ..config.settings import get_settings, Settings
-import ccxt
-from typing import Dict, Any, List, Optional
-from decimal import Decimal
-from ccxt.binance import binance
+import ccxt.async_support as ccxt
+import aiohttp
+import asyncio
+import json
+import os
+import random
+import ssl
+import time
+from functools import wraps
+from typing import Awaitable, Callable, Dict, Any, List, NamedTuple, Optional, Tuple, Type, TypeVar
+from decimal import ROUND_DOWN, Decimal
+from ccxt.async_support.binance import binance
 from loguru import logger
 
 from ..core.exceptions import (
@@ -12,7 +20,146 @@ from ..core.exceptions import (
     TradingError,
     InvalidOrderError
 )
-from ..core.types import OrderType, OrderSide
+from .order_batcher import OrderBatcher
+from .rate_limiter import WeightThrottler
+from ..core.types import OrderType, OrderSide, BUY, SELL, MARKET, LIMIT, to_decimal_for_exchange
+
+# How long a fetched last price may be reused when sizing USDT orders
+TICKER_CACHE_TTL = 0.25
+
+# How long a fetched balance may be reused; placing or closing orders discards it
+BALANCE_CACHE_TTL = 0.5
+
+# Idle time before pooled exchange connections are dropped. aiohttp's 15 s default is
+# shorter than the gap between most MCP turns, so orders would pay a fresh TLS handshake.
+HTTP_KEEPALIVE_TIMEOUT = 60
+
+# How long resolved exchange hostnames are reused
+DNS_CACHE_TTL = 300
+
+# How long market metadata saved to disk is reused before it is downloaded again
+MARKETS_CACHE_TTL = 24 * 60 * 60
+
+# Retries for read-only calls failing with a transient ccxt network error. Backoff doubles
+# from the base up to the cap, plus jitter; kept short because an LLM is waiting on the call.
+READ_RETRIES = 3
+RETRY_BACKOFF_BASE = 0.5
+RETRY_BACKOFF_MAX = 4.0
+RETRY_JITTER = 0.25
+
+
+class MarketLimits(NamedTuple):
+    """Order sizing and routing fields snapshotted from a ccxt market."""
+    symbol: str
+    min_amount: Decimal
+    amount_step: Optional[Decimal]
+    price_step: Optional[Decimal]
+    linear: bool
+
+
+def _to_decimal(value: Any) -> Optional[Decimal]:
+    return None if value is None else Decimal(str(value))
+
+
+def _truncate_to_step(value: Decimal, step: Decimal) -> Decimal:
+    return (value / step).to_integral_value(ROUND_DOWN) * step
+
+
+def _market_limits(market: Dict[str, Any]) -> MarketLimits:
+    return MarketLimits(
+        symbol=market['symbol'],
+        min_amount=_to_decimal(market['limits']['amount']['min']) or Decimal(0),
+        amount_step=_to_decimal(market['precision']['amount']),
+        price_step=_to_decimal(market['precision']['price']),
+        linear=bool(market.get('linear')),
+    )
+
+
+def _read_markets_cache(path: str, key: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Markets and currencies saved under key, or None if missing, stale or unreadable."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cached, dict):
+        return None
+    if cached.get('key') != key or time.time() - cached.get('saved_at', 0) > MARKETS_CACHE_TTL:
+        return None
+    return cached
+
+
+def _write_markets_cache(path: str, key: Dict[str, Any], markets: Dict[str, Any], currencies: Any) -> None:
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    # Write then rename so a concurrent reader never sees a partial file
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({'key': key, 'saved_at': time.time(), 'markets': markets, 'currencies': currencies}, f)
+    os.replace(tmp_path, path)
+
+
+_Method = TypeVar("_Method", bound=Callable[..., Awaitable[Any]])
+
+
+def _retry_delay(exchange: binance, e: Exception, attempt: int) -> Optional[float]:
+    """Seconds to wait before retrying after e, or None if waiting isn't worthwhile."""
+    if isinstance(e, (ccxt.RateLimitExceeded, ccxt.DDoSProtection)):
+        # Binance says how long a 429/418 lasts; honour it unless it outlasts the backoff cap
+        retry_after = (exchange.last_response_headers or {}).get('Retry-After')
+        if retry_after is not None:
+            try:
+                delay = float(retry_after)
+            except ValueError:
+                pass
+            else:
+                return delay if delay <= RETRY_BACKOFF_MAX else None
+    return min(RETRY_BACKOFF_BASE * 2 ** attempt, RETRY_BACKOFF_MAX) + random.uniform(0, RETRY_JITTER)
+
+
+def _ccxt_guard(
+    action: str,
+    error: Type[ExchangeError] = ExchangeError,
+    retries: int = 0
+) -> Callable[[_Method], _Method]:
+    """Require an initialized exchange and translate errors raised by an ExchangeClient method.
+    
+    ccxt authentication, network and invalid-order errors map to their project exceptions,
+    project ExchangeErrors pass through unchanged, and anything else is re-raised as error
+    with a "Failed to <action>" message. Network errors are retried up to retries times
+    with backoff, so only pass retries for idempotent calls.
+    """
+    failure_prefix = "Failed to " + action + ": "
+    
+    def decorator(method: _Method) -> _Method:
+        @wraps(method)
+        async def wrapper(self: "ExchangeClient", *args: Any, **kwargs: Any) -> Any:
+            if not self.exchange:
+                raise ExchangeError("Exchange client not initialized")
+            
+            attempt = 0
+            while True:
+                try:
+                    return await method(self, *args, **kwargs)
+                except ccxt.AuthenticationError as e:
+                    raise AuthenticationError(f"Authentication failed: {e}")
+                except ccxt.NetworkError as e:
+                    delay = _retry_delay(self.exchange, e, attempt) if attempt < retries else None
+                    if delay is None:
+                        raise NetworkError(f"Network error: {e}")
+                    attempt += 1
+                    self.logger.warning("Retrying {} in {:.2f}s after network error: {}", action, delay, e)
+                    await asyncio.sleep(delay)
+                except ccxt.InvalidOrder as e:
+                    raise InvalidOrderError(f"Invalid order: {e}")
+                except ExchangeError:
+                    # Already translated, e.g. by the batcher or an inner guarded call
+                    raise
+                except Exception as e:
+                    raise error(failure_prefix + str(e))
+        return wrapper  # type: ignore[return-value]
+    return decorator
 
 
 class ExchangeClient:
@@ -20,10 +167,29 @@ class ExchangeClient:
     def __init__(self, config: Settings):
         self.config = config
         self.logger = logger.bind(component="exchange_client")
-        self.exchange: binance
+        self.exchange: Optional[binance] = None
+        self._batcher: Optional[OrderBatcher] = None
+        # ccxt market symbol -> (monotonic fetch start time, last price fetch); concurrent callers share the fetch
+        self._ticker_cache: Dict[str, Tuple[float, "asyncio.Future[Decimal]"]] = {}
+        # (monotonic fetch time, balance) from the last fetch_balance call
+        self._balance_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+        # Bumped whenever trading invalidates the balance, so a fetch begun earlier isn't cached
+        self._balance_generation = 0
+        # ccxt market symbol -> sizing limits, built when markets are loaded
+        self._limits: Optional[Dict[str, MarketLimits]] = None
+        # Caller-supplied symbol or market id -> its resolved entry in _limits
+        self._resolved_limits: Dict[str, MarketLimits] = {}
+        # True while markets come from the on-disk cache, which may predate new listings
+        self._markets_from_cache = False
+        # Serializes market loads so concurrent tool calls share one download
+        self._markets_lock = asyncio.Lock()
         
     def initialize(self) -> None:
+        """Create the exchange client.
         
+        Markets are loaded on first use, inside the event loop that serves requests,
+        so no network I/O happens here.
+        """
         try:
             self.exchange = ccxt.binance({
                 'apiKey': self.config.exchange.api_key,
@@ -31,72 +197,88 @@ class ExchangeClient:
                 'enableRateLimit': self.config.exchange.rate_limit,
                 'options': {
                     'defaultType': self.config.exchange.default_type,
+                    # Signed requests older than this many ms are rejected by Binance
+                    'recvWindow': self.config.exchange.recv_window,
+                    # Sign with the server's clock so local drift doesn't cause -1021 rejections
+                    'adjustForTimeDifference': True,
                 }
             })
             
             if self.config.exchange.sandbox_mode:
                 self.exchange.set_sandbox_mode(True)
+            
+            if self.config.exchange.rate_limit:
+                # ccxt charges each call its endpoint weight; rateLimit is ms per unit of weight
+                self.exchange.throttler = WeightThrottler(1000 / self.exchange.rateLimit)
 
-            self.exchange.load_markets()
+            self._limits = None
+            self._resolved_limits = {}
+            self._markets_from_cache = False
+            self._batcher = OrderBatcher(self.exchange)
             self.exchange.verbose = self.config.debug
             self.logger.info("Exchange client initialized successfully")
             
-        except ccxt.AuthenticationError as e:
-            raise AuthenticationError(f"Exchange authentication failed: {e}")
-        except ccxt.NetworkError as e:
-            raise NetworkError(f"Exchange network error: {e}")
         except Exception as e:
             raise ExchangeError(f"Exchange initialization failed: {e}")
     
-    def retrieve_balance(self) -> Dict[str, Any]:
-        if not self.exchange:
-            raise ExchangeError("Exchange client not initialized")
+    async def open(self) -> None:
+        """Give the exchange client a pooled HTTP session with long-lived connections.
         
-        try:
-            balance = self.exchange.fetch_balance()
-            self.logger.debug("Balance fetched successfully")
-            return balance
-            
-        except ccxt.AuthenticationError as e:
-            raise AuthenticationError(f"Authentication failed: {e}")
-        except ccxt.NetworkError as e:
-            raise NetworkError(f"Network error: {e}")
-        except Exception as e:
-            raise ExchangeError(f"Failed to fetch balance: {e}")
-    
-    def fetch_positions(self, symbols: Optional[List[str]] = None) -> List[Dict[str, Any]]:
-        if not self.exchange:
-            raise ExchangeError("Exchange client not initialized")
+        Must be awaited inside the event loop that serves requests. Without it, ccxt
+        opens a session with aiohttp's default connector on the first request.
+        """
+        if self.exchange is None or self.exchange.session is not None:
+            return
         
-        try:
-            positions = self.exchange.fetch_positions(symbols)
-            self.logger.debug(f"Fetched {len(positions)} positions")
-            return positions
-            
-        except ccxt.AuthenticationError as e:
-            raise AuthenticationError(f"Authentication failed: {e}")
-        except ccxt.NetworkError as e:
-            raise NetworkError(f"Network error: {e}")
-        except Exception as e:
-            raise ExchangeError(f"Failed to fetch positions: {e}")
+        connector = aiohttp.TCPConnector(
+            ssl=ssl.create_default_context(cafile=self.exchange.cafile) if self.exchange.verify else False,
+            keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT,
+            ttl_dns_cache=DNS_CACHE_TTL,
+        )
+        # ccxt still owns the session, so exchange.close() releases both
+        self.exchange.tcp_connector = connector
+        self.exchange.session = aiohttp.ClientSession(connector=connector, trust_env=self.exchange.aiohttp_trust_env)
     
-    def fetch_open_orders(self, symbol: Optional[str] = None) -> List[Dict[str, Any]]:
-        if not self.exchange:
-            raise ExchangeError("Exchange client not initialized")
+    async def close(self) -> None:
+        """Release the exchange client's HTTP session."""
+        if self._batcher is not None:
+            await self._batcher.close()
+        if self.exchange is not None:
+            await self.exchange.close()
+    
+    @_ccxt_guard("fetch balance", retries=READ_RETRIES)
+    async def retrieve_balance(self, max_age: float = BALANCE_CACHE_TTL) -> Dict[str, Any]:
+        """Account balance, reusing a fetch younger than max_age seconds."""
+        now = time.monotonic()
+        cached = self._balance_cache
+        if cached is not None and now - cached[0] <= max_age:
+            return cached[1]
         
-        try:
-            orders = self.exchange.fetch_open_orders(symbol)
-            self.logger.debug(f"Fetched {len(orders)} open orders")
-            return orders
-            
-        except ccxt.AuthenticationError as e:
-            raise AuthenticationError(f"Authentication failed: {e}")
-        except ccxt.NetworkError as e:
-            raise NetworkError(f"Network error: {e}")
-        except Exception as e:
-            raise ExchangeError(f"Failed to fetch open orders: {e}")
+        generation = self._balance_generation
+        balance = await self.exchange.fetch_balance()
+        if generation == self._balance_generation:
+            self._balance_cache = (now, balance)
+        self.logger.debug("Balance fetched successfully")
+        return balance
+    
+    def _invalidate_balance(self) -> None:
+        self._balance_cache = None
+        self._balance_generation += 1
+    
+    @_ccxt_guard("fetch positions", retries=READ_RETRIES)
+    async def fetch_positions(self, symbols: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        positions = await self.exchange.fetch_positions(symbols)
+        self.logger.debug("Fetched {} positions", len(positions))
+        return positions
+    
+    @_ccxt_guard("fetch open orders", retries=READ_RETRIES)
+    async def fetch_open_orders(self, symbol: Optional[str] = None) -> List[Dict[str, Any]]:
+        orders = await self.exchange.fetch_open_orders(symbol)
+        self.logger.debug("Fetched {} open orders", len(orders))
+        return orders
 
-    def create_order(
+    @_ccxt_guard("create order", TradingError)
+    async def create_order(
         self,
         symbol: str,
         order_type: OrderType,
@@ -106,37 +288,38 @@ class ExchangeClient:
         params: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """Create an order on the exchange."""
-        if not self.exchange:
-            raise ExchangeError("Exchange client not initialized")
-
-        try:
-            order_params = params or {}
-            
-            if order_type == OrderType.LIMIT and price is None:
-                raise InvalidOrderError("Price is required for limit orders")
-            
-            order = self.exchange.create_order(
+        order_params = params or {}
+        
+        if order_type == LIMIT and price is None:
+            raise InvalidOrderError("Price is required for limit orders")
+        
+        if (await self._get_limits(symbol)).linear:
+            # Concurrent futures orders share one batchOrders request
+            order = await self._batcher.submit(
+                symbol,
+                order_type,
+                side,
+                str(amount),
+                str(price) if price else None,
+                order_params
+            )
+        else:
+            order = await self.exchange.create_order(
                 symbol=symbol,
                 type=order_type,
                 side=side,
-                amount=float(amount),
-                price=float(price) if price else None,
+                amount=str(amount),
+                price=str(price) if price else None,
                 params=order_params
             )
-            
-            self.logger.info(f"Order created: {order.get('id')} - {side} {amount} {symbol}")
-            return order
-            
-        except ccxt.AuthenticationError as e:
-            raise AuthenticationError(f"Authentication failed: {e}")
-        except ccxt.NetworkError as e:
-            raise NetworkError(f"Network error: {e}")
-        except ccxt.InvalidOrder as e:
-            raise InvalidOrderError(f"Invalid order: {e}")
-        except Exception as e:
-            raise TradingError(f"Failed to create order: {e}")
 
-    def create_usdt_order(
+        self._invalidate_balance()
+        # Message arguments are only formatted when a sink accepts the record
+        self.logger.info("Order created: {} - {} {} {}", order.get('id'), side, amount, symbol)
+        return order
+
+    @_ccxt_guard("create USDT order", TradingError)
+    async def create_usdt_order(
         self,
         symbol: str,
         order_type: OrderType,
@@ -145,120 +328,269 @@ class ExchangeClient:
         price: Optional[Decimal] = None,
         params: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
-        if not self.exchange:
-            raise ExchangeError("Exchange client not initialized")
+        # Resolved before the ticker fetch, so a symbol missing from cached markets is reloaded first
+        limits = await self._get_limits(symbol)
+        if order_type == LIMIT and price is not None:
+            # A limit order is sized at its own price; no ticker fetch needed
+            reference_price = price
+        else:
+            # Keyed by the resolved symbol, so 'BTCUSDT' and 'BTC/USDT' share one fetch
+            reference_price = await self._get_last_price(limits.symbol)
+        
+        amount = usdt_amount / reference_price
+        if limits.amount_step is not None:
+            # Truncate as the exchange would, so the minimum check sees the submitted size
+            amount = _truncate_to_step(amount, limits.amount_step)
+        min_amount = limits.min_amount
+        if amount < min_amount:
+            raise InvalidOrderError(f"Amount {amount} is less than minimum required amount {min_amount}")
+        
+        return await self.create_order(
+            symbol=symbol,
+            order_type=order_type,
+            side=side,
+            amount=amount,
+            price=price,
+            params=params
+        )
 
+    async def _get_last_price(self, symbol: str, max_age: float = TICKER_CACHE_TTL) -> Decimal:
+        """Last traded price for symbol, reusing a fetch started less than max_age seconds ago."""
+        now = time.monotonic()
+        cached = self._ticker_cache.get(symbol)
+        if cached is None or now - cached[0] > max_age:
+            cached = self._ticker_cache[symbol] = (now, asyncio.ensure_future(self._fetch_last_price(symbol)))
+        
         try:
-            current_symbol_price = Decimal(str(self.exchange.fetch_ticker(symbol)['last']))
-            
-            amount = usdt_amount / current_symbol_price
-            market = self.exchange.market(symbol)
-            min_amount = market['limits']['amount']['min']
-            if amount < min_amount:
-                raise InvalidOrderError(f"Amount {amount} is less than minimum required amount {min_amount}")
-            
-            return self.create_order(
-                symbol=symbol,
-                order_type=order_type,
-                side=side,
-                amount=amount,
-                price=price,
-                params=params
+            # Shielded so one caller being cancelled doesn't cancel the fetch for the others
+            return await asyncio.shield(cached[1])
+        except Exception:
+            if self._ticker_cache.get(symbol) is cached:
+                del self._ticker_cache[symbol]
+            raise
+
+    async def _fetch_last_price(self, symbol: str) -> Decimal:
+        return Decimal(str((await self.exchange.fetch_ticker(symbol))['last']))
+
+    async def _ensure_markets(self) -> None:
+        """Load markets and snapshot per-symbol sizing limits on first use."""
+        if self._limits is not None:
+            return
+        
+        async with self._markets_lock:
+            if self._limits is not None:
+                return
+            self._set_limits(await self._load_markets())
+
+    async def _reload_markets(self) -> None:
+        """Download markets again, replacing ones loaded from the on-disk cache."""
+        async with self._markets_lock:
+            if not self._markets_from_cache:
+                # Another caller reloaded while this one waited for the lock
+                return
+            markets = await self.exchange.load_markets(reload=True)
+            self._markets_from_cache = False
+            self._set_limits(markets)
+            await self._save_markets_cache(markets)
+
+    def _set_limits(self, markets: Dict[str, Any]) -> None:
+        self._limits = {symbol: _market_limits(market) for symbol, market in markets.items()}
+        self._resolved_limits = {}
+
+    def _markets_cache_key(self) -> Dict[str, Any]:
+        # The ccxt version is part of the key because the shape of its market dicts can change
+        return {
+            'sandbox': self.config.exchange.sandbox_mode,
+            'default_type': self.config.exchange.default_type,
+            'ccxt': ccxt.__version__,
+        }
+
+    async def _load_markets(self) -> Dict[str, Any]:
+        """Markets from the on-disk cache while it is fresh, otherwise from the exchange."""
+        path = self.config.exchange.markets_cache_path
+        if not path:
+            return await self.exchange.load_markets()
+        
+        # Read without yielding, so a concurrent ccxt call can't start its own market download
+        cached = _read_markets_cache(path, self._markets_cache_key())
+        if cached is not None:
+            markets = self.exchange.set_markets(cached['markets'], cached['currencies'])
+            self._markets_from_cache = True
+            if self.exchange.options.get('adjustForTimeDifference'):
+                # ccxt syncs the clock offset inside fetch_markets, which the cache skips
+                await self.exchange.load_time_difference()
+            return markets
+        
+        markets = await self.exchange.load_markets()
+        await self._save_markets_cache(markets)
+        return markets
+
+    async def _save_markets_cache(self, markets: Dict[str, Any]) -> None:
+        path = self.config.exchange.markets_cache_path
+        if not path:
+            return
+        try:
+            await asyncio.to_thread(
+                _write_markets_cache, path, self._markets_cache_key(), markets, self.exchange.currencies
             )
-            
-        except Exception as e:
-            raise TradingError(f"Failed to create USDT order: {e}")
+        except (OSError, TypeError, ValueError) as e:
+            self.logger.warning("Could not save markets cache: {}", e)
 
-    def market_buy(self, symbol: str, usdt_amount: Decimal) -> Dict[str, Any]:
-        return self.create_usdt_order(
+    async def _get_limits(self, symbol: str) -> MarketLimits:
+        """Sizing limits for symbol, loading markets on first use."""
+        await self._ensure_markets()
+        limits = self._resolved_limits.get(symbol)
+        if limits is None:
+            # Always resolve through ccxt: besides ids like 'BTCUSDT', it maps 'BTC/USDT' to the
+            # contract market when defaultType is future, although a spot market has that key
+            try:
+                market = self.exchange.market(symbol)
+            except ccxt.BadSymbol:
+                if not self._markets_from_cache:
+                    raise
+                # The symbol may have been listed after the cached markets were saved
+                await self._reload_markets()
+                market = self.exchange.market(symbol)
+            limits = self._resolved_limits[symbol] = self._limits[market['symbol']]
+        return limits
+
+    async def _to_exchange_price(self, symbol: str, price: float) -> Decimal:
+        """Convert a caller-supplied price to a Decimal on the market's price tick."""
+        tick = (await self._get_limits(symbol)).price_step
+        if tick is None:
+            return Decimal(str(price))
+        return to_decimal_for_exchange(price, tick)
+
+    async def market_buy(self, symbol: str, usdt_amount: Decimal) -> Dict[str, Any]:
+        return await self.create_usdt_order(
             symbol=symbol,
-            order_type=OrderType.MARKET,
-            side=OrderSide.BUY,
+            order_type=MARKET,
+            side=BUY,
             usdt_amount=usdt_amount
         )
 
-    def market_sell(self, symbol: str, usdt_amount: Decimal) -> Dict[str, Any]:
-        return self.create_usdt_order(
+    async def market_sell(self, symbol: str, usdt_amount: Decimal) -> Dict[str, Any]:
+        return await self.create_usdt_order(
             symbol=symbol,
-            order_type=OrderType.MARKET,
-            side=OrderSide.SELL,
+            order_type=MARKET,
+            side=SELL,
             usdt_amount=usdt_amount
         )
 
-    def limit_buy(self, symbol: str, usdt_amount: Decimal, price: Decimal) -> Dict[str, Any]:
-        return self.create_usdt_order(
+    async def limit_buy(self, symbol: str, usdt_amount: Decimal, price: float) -> Dict[str, Any]:
+        return await self.create_usdt_order(
             symbol=symbol,
-            order_type=OrderType.LIMIT,
-            side=OrderSide.BUY,
+            order_type=LIMIT,
+            side=BUY,
             usdt_amount=usdt_amount,
-            price=price
+            price=await self._to_exchange_price(symbol, price)
         )
 
-    def limit_sell(self, symbol: str, usdt_amount: Decimal, price: Decimal) -> Dict[str, Any]:
-        return self.create_usdt_order(
+    async def limit_sell(self, symbol: str, usdt_amount: Decimal, price: float) -> Dict[str, Any]:
+        return await self.create_usdt_order(
             symbol=symbol,
-            order_type=OrderType.LIMIT,
-            side=OrderSide.SELL,
+            order_type=LIMIT,
+            side=SELL,
             usdt_amount=usdt_amount,
-            price=price
+            price=await self._to_exchange_price(symbol, price)
         )
 
-    def close_position(self, symbol: str) -> str:
-        if not self.exchange:
-            raise ExchangeError("Exchange client not initialized")
+    async def _position_infos(self, symbol: str) -> List[Dict[str, Any]]:
+        """Raw Binance position entries for symbol, through ccxt's fetch_positions."""
+        return [position['info'] for position in await self.exchange.fetch_positions([symbol])]
+
+    @_ccxt_guard("close position", TradingError)
+    async def close_position(self, symbol: str) -> str:
+        linear = (await self._get_limits(symbol)).linear
+        if linear:
+            # Filtered server-side, and skips the leverage-bracket download fetch_positions makes first
+            fetch_infos = self.exchange.fapiPrivateV3GetPositionRisk({'symbol': self.exchange.market_id(symbol)})
+        else:
+            fetch_infos = self._position_infos(symbol)
         
-        try:
-            positions = self.exchange.fetch_positions([symbol])
-            closed_positions = []
-            
-            for position in positions:
-                position_amt = float(position['info'].get('positionAmt', 0))
-                
-                if position_amt != 0:
-                    size = abs(position_amt)
-                    side = 'sell' if position_amt > 0 else 'buy'  # Opposite side to close
-                    
-                    order = self.exchange.create_order(
-                        symbol=symbol,
-                        type='market',
-                        side=side,
-                        amount=size,
-                        params={'reduceOnly': True}  # Ensures it closes position
-                    )
-                    
-                    closed_positions.append({
-                        'symbol': symbol,
-                        'size': size,
-                        'side': side,
-                        'order_id': order.get('id')
-                    })
-            
-            if not closed_positions:
-                return f"No open positions found for {symbol}"
-            
-            message = f"Closed {len(closed_positions)} position(s) for {symbol}"
-            self.logger.info(message)
-            return message
+        # Sweep resting orders while positions are fetched; neither depends on the other
+        sweep, infos = await asyncio.gather(
+            self.exchange.cancel_all_orders(symbol),
+            fetch_infos,
+            return_exceptions=True
+        )
+        if isinstance(infos, BaseException):
+            raise infos
+        # Flattening the position matters more than the sweep, so a failed sweep is only reported
+        if isinstance(sweep, BaseException):
+            sweep_note = f"; failed to cancel open orders ({sweep})"
+            self.logger.warning("Failed to cancel open orders for {}: {}", symbol, sweep)
+        else:
+            sweep_note = "; open orders cancelled"
+        
+        closes = []
+        for info in infos:
+            position_amt = float(info.get('positionAmt', 0))
+            if position_amt == 0:
+                continue
             
-        except ccxt.AuthenticationError as e:
-            raise AuthenticationError(f"Authentication failed: {e}")
-        except ccxt.NetworkError as e:
-            raise NetworkError(f"Network error: {e}")
-        except Exception as e:
-            raise TradingError(f"Failed to close position: {e}")
-    
-    def fetch_ticker(self, symbol: str) -> Dict[str, Any]:
-        if not self.exchange:
-            raise ExchangeError("Exchange client not initialized")
+            position_side = info.get('positionSide', 'BOTH')
+            closes.append({
+                'size': abs(position_amt),
+                'side': 'sell' if position_amt > 0 else 'buy',  # Opposite side to close
+                # Hedge-mode legs are closed by positionSide; reduceOnly is rejected there
+                'params': {'reduceOnly': True} if position_side == 'BOTH' else {'positionSide': position_side},
+            })
+        
+        def submit_close(close: Dict[str, Any]) -> Awaitable[Dict[str, Any]]:
+            if linear:
+                # Submitted together, linear closes leave in a single batchOrders request
+                return self._batcher.submit(symbol, MARKET, close['side'], close['size'], None, close['params'])
+            # The batcher only takes linear markets: ccxt picks a batch's endpoint from its first order
+            return self.exchange.create_order(
+                symbol=symbol,
+                type=MARKET,
+                side=close['side'],
+                amount=close['size'],
+                params=close['params']
+            )
         
         try:
-            ticker = self.exchange.fetch_ticker(symbol)
-            return ticker
-            
-        except ccxt.NetworkError as e:
-            raise NetworkError(f"Network error: {e}")
-        except Exception as e:
-            raise ExchangeError(f"Failed to fetch ticker: {e}")
+            # Each leg succeeds or fails on its own, so one rejection must not hide a leg that filled
+            results = await asyncio.gather(*map(submit_close, closes), return_exceptions=True)
+        finally:
+            self._invalidate_balance()
+        
+        if not closes:
+            return f"No open positions found for {symbol}" + sweep_note
+        
+        closed_positions = []
+        failed_positions = []
+        for close, result in zip(closes, results):
+            if isinstance(result, BaseException):
+                failed_positions.append((close, result))
+            else:
+                closed_positions.append({
+                    'symbol': symbol,
+                    'size': close['size'],
+                    'side': close['side'],
+                    'order_id': result.get('id')
+                })
+        
+        if not closed_positions:
+            raise failed_positions[0][1]
+        
+        message = f"Closed {len(closed_positions)} position(s) for {symbol}"
+        if failed_positions:
+            message += "; failed to close " + ", ".join(
+                f"{close['side']} {close['size']} ({error})" for close, error in failed_positions
+            )
+        message += sweep_note
+        if failed_positions or isinstance(sweep, BaseException):
+            self.logger.warning(message)
+        else:
+            self.logger.info(message)
+        return message
+    
+    @_ccxt_guard("fetch ticker", retries=READ_RETRIES)
+    async def fetch_ticker(self, symbol: str) -> Dict[str, Any]:
+        ticker = await self.exchange.fetch_ticker(symbol)
+        return ticker
     
     def is_connected(self) -> bool:
         """Check if exchange client is connected and initialized."""
@@ -0,0 +1,141 @@
+"""Coalesce concurrent futures orders into Binance batchOrders requests."""
+
+import asyncio
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple, Union
+from loguru import logger
+
+from ..core.exceptions import ExchangeError, InvalidOrderError
+
+if TYPE_CHECKING:
+    from ccxt.async_support.binance import binance
+
+# How long the first queued order waits for companions before its batch is sent
+BATCH_FLUSH_INTERVAL = 0.005
+
+# Binance accepts at most 5 orders per batchOrders request
+MAX_BATCH_SIZE = 5
+
+_PendingOrder = Tuple[Dict[str, Any], "asyncio.Future[Dict[str, Any]]"]
+
+
+class OrderBatcher:
+    """Queue orders submitted concurrently and send them as one batchOrders request.
+
+    A lone order is sent through the regular create_order endpoint, so batching only
+    changes the request shape when several tool calls place orders at the same time.
+    Orders must belong to linear (USDT-margined) contract markets.
+    """
+
+    def __init__(
+        self,
+        exchange: "binance",
+        flush_interval: float = BATCH_FLUSH_INTERVAL,
+        max_batch: int = MAX_BATCH_SIZE
+    ):
+        self.exchange = exchange
+        self.flush_interval = flush_interval
+        self.max_batch = max_batch
+        self.logger = logger.bind(component="order_batcher")
+        self._queue: Optional["asyncio.Queue[_PendingOrder]"] = None
+        self._flusher: Optional["asyncio.Task[None]"] = None
+        self._in_flight: Set["asyncio.Task[None]"] = set()
+
+    async def submit(
+        self,
+        symbol: str,
+        order_type: str,
+        side: str,
+        amount: Union[str, float],
+        price: Union[str, float, None] = None,
+        params: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Queue an order and wait for the exchange's response to it."""
+        if self._flusher is None or self._flusher.done():
+            self._queue = asyncio.Queue()
+            self._flusher = asyncio.create_task(self._flush_loop())
+
+        future: "asyncio.Future[Dict[str, Any]]" = asyncio.get_running_loop().create_future()
+        order = {
+            'symbol': symbol,
+            'type': order_type,
+            'side': side,
+            'amount': amount,
+            'price': price,
+            'params': params or {},
+        }
+        self._queue.put_nowait((order, future))
+        return await future
+
+    async def close(self) -> None:
+        """Stop collecting orders and fail those not yet sent; batches already sent are left to complete."""
+        if self._flusher is not None:
+            self._flusher.cancel()
+            # Lets the flusher fail the batch it was collecting before the queue is drained
+            await asyncio.gather(self._flusher, return_exceptions=True)
+            self._flusher = None
+        if self._queue is not None:
+            unsent = []
+            while not self._queue.empty():
+                unsent.append(self._queue.get_nowait())
+            self._fail_unsent(unsent)
+        if self._in_flight:
+            await asyncio.gather(*self._in_flight, return_exceptions=True)
+
+    async def _flush_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        batch: List[_PendingOrder] = []
+        try:
+            while True:
+                batch = [await self._queue.get()]
+                deadline = loop.time() + self.flush_interval
+                while len(batch) < self.max_batch:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+
+                # Send without blocking collection of the next batch
+                task = asyncio.create_task(self._send(batch))
+                self._in_flight.add(task)
+                task.add_done_callback(self._in_flight.discard)
+                batch = []
+        except asyncio.CancelledError:
+            self._fail_unsent(batch)
+            raise
+
+    @staticmethod
+    def _fail_unsent(orders: List[_PendingOrder]) -> None:
+        for _, future in orders:
+            if not future.done():
+                future.set_exception(ExchangeError("Order batcher closed"))
+
+    async def _send(self, batch: List[_PendingOrder]) -> None:
+        try:
+            if len(batch) == 1:
+                order, _ = batch[0]
+                results = [await self.exchange.create_order(**order)]
+            else:
+                results = await self.exchange.create_orders([order for order, _ in batch])
+                self.logger.debug("Sent {} orders in one batch", len(batch))
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                continue
+            info = result.get('info') or {}
+            if result.get('id') is None and 'code' in info:
+                # batchOrders reports per-order failures inline as {"code": ..., "msg": ...}
+                future.set_exception(InvalidOrderError(info.get('msg', 'Order rejected'), exchange_code=str(info['code'])))
+            else:
+                future.set_result(result)
+
+        for _, future in batch:
+            if not future.done():
+                future.set_exception(InvalidOrderError("Exchange returned no result for order"))
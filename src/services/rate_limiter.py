@@ -0,0 +1,36 @@
+"""Request-weight token bucket used in place of ccxt's built-in throttler."""
+
+import asyncio
+import time
+from typing import Optional
+
+# Request weight that may be spent back-to-back before calls are spaced out
+RATE_LIMIT_BURST = 100
+
+
+class WeightThrottler:
+    """Token bucket over Binance request weight that lets bursts through.
+
+    ccxt awaits ``exchange.throttler(cost)`` before every REST call, with cost set to the
+    endpoint's weight. Its own bucket only refills while calls are queued, so every call
+    after an idle period still waits for the previous call's weight to drain. Here tokens
+    keep accruing while idle, up to capacity, and long-run throughput stays at refill_rate.
+    """
+
+    def __init__(self, refill_rate: float, capacity: float = RATE_LIMIT_BURST):
+        self.refill_rate = refill_rate  # weight per second
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        # Held while a caller waits out a deficit, so waiters are released in arrival order
+        self._lock = asyncio.Lock()
+
+    async def __call__(self, cost: Optional[float] = None) -> None:
+        cost = 1.0 if cost is None else cost
+        async with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.refill_rate)
+            self._updated = now
+            self._tokens -= cost
+            if self._tokens < 0:
+                await asyncio.sleep(-self._tokens / self.refill_rate)